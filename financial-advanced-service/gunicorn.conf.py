@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Financial Advanced Service
+Configuração do Gunicorn para o Serviço Financeiro Avançado
+
+Usage / Uso:
+    gunicorn -c gunicorn.conf.py src.main:app
+"""
+
+import multiprocessing
+import os
+
+# Server socket / Socket do servidor
+bind = f"0.0.0.0:{os.getenv('PORT', '5002')}"
+
+# Worker processes / Processos de trabalho
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+keepalive = 5
+
+# Split the database connection budget across workers (read by ConfigService in each worker)
+# Dividir o orçamento de conexões do banco entre os workers (lido pelo ConfigService em cada worker)
+_max_connections = int(os.getenv('DB_MAX_CONNECTIONS', '151'))  # MySQL default / Padrão do MySQL
+_per_worker = max(1, _max_connections // workers)
+os.environ.setdefault('DB_POOL_SIZE', str(min(threads, _per_worker)))
+os.environ.setdefault('DB_MAX_OVERFLOW', str(max(0, _per_worker - int(os.environ['DB_POOL_SIZE']))))
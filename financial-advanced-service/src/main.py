@@ -32,6 +32,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, send_from_directory, jsonify, g, request
 from flask_cors import CORS
+from werkzeug.utils import safe_join
+from sqlalchemy import text
 from src.models.financial_models import db
 from src.services.audit_service import AuditService, audit_required
 from src.services.config_service import ConfigService
@@ -39,13 +41,25 @@ from src.routes.analytics import analytics_bp
 from src.routes.risk_management import risk_bp
 from src.routes.reporting import reporting_bp
 from src.routes.integration import integration_bp
+from src.utils.json_provider import OrjsonProvider
+from src.utils.cache import init_cache
 import logging
+import time
+from pathlib import Path
+import orjson
 from datetime import datetime
 
 # Initialize Flask application / Inicializar aplicação Flask
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = ConfigService.SECURITY_CONFIG['jwt_secret_key']
 
+# Match routes with or without a trailing slash instead of redirecting
+# Aceitar rotas com ou sem barra final em vez de redirecionar
+app.url_map.strict_slashes = False
+
+# Serialize JSON responses with orjson / Serializar respostas JSON com orjson
+app.json = OrjsonProvider(app)
+
 # Enable CORS for all routes with frontend URL / Habilitar CORS para todas as rotas com URL do frontend
 CORS(app, origins=[
     ConfigService.FRONTEND_BASE_URL,
@@ -60,6 +74,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Process-lifetime settings read once at import / Configurações lidas uma vez na importação
+_FRONTEND_URL = ConfigService.FRONTEND_BASE_URL
+_AUDIT_ENABLED = ConfigService.is_audit_enabled()
+_LOG_ALL_REQUESTS = ConfigService.AUDIT_CONFIG.get('log_all_requests', False)
+
+# Initialize response cache / Inicializar cache de respostas
+init_cache(app)
+
 # Register blueprints / Registrar blueprints
 app.register_blueprint(analytics_bp, url_prefix='/api/analytics')
 app.register_blueprint(risk_bp, url_prefix='/api/risk')
@@ -71,13 +93,19 @@ app.config['SQLALCHEMY_DATABASE_URI'] = ConfigService.get_database_url()
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_size': ConfigService.DATABASE_CONFIG['pool_size'],
+    'max_overflow': ConfigService.DATABASE_CONFIG['max_overflow'],
     'pool_timeout': ConfigService.DATABASE_CONFIG['pool_timeout'],
-    'pool_recycle': ConfigService.DATABASE_CONFIG['pool_recycle']
+    'pool_recycle': ConfigService.DATABASE_CONFIG['pool_recycle'],
+    'pool_pre_ping': True,
+    'pool_use_lifo': True
 }
 
 # Initialize database / Inicializar banco de dados
 db.init_app(app)
 
+# Start background audit writer / Iniciar gravador de auditoria em segundo plano
+AuditService.init_app(app)
+
 # Create tables / Criar tabelas
 with app.app_context():
     try:
@@ -86,6 +114,84 @@ with app.app_context():
     except Exception as e:
         logger.error(f"Failed to create database tables / Falha ao criar tabelas do banco de dados: {str(e)}")
 
+# Static parts of the health payload, built once / Partes estáticas do payload de saúde, construídas uma vez
+_HEALTH_TEMPLATE = {
+    'status': 'healthy',
+    'service': 'Construction Hub Financial Advanced Service',
+    'version': '1.0.0',
+    'timestamp': None,
+    'frontend_base_url': _FRONTEND_URL,
+    'database_status': None,
+    'features': [
+        'Advanced Financial Analytics / Análise Financeira Avançada',
+        'Risk Management System / Sistema de Gerenciamento de Riscos',
+        'Financial Reporting Advanced / Relatórios Financeiros Avançados',
+        'Integration Hub / Hub de Integração',
+        'Real-time Monitoring / Monitoramento em Tempo Real',
+        'Canadian Banking Integration / Integração Bancária Canadense',
+        'Audit Trail System / Sistema de Trilha de Auditoria'
+    ],
+    'supported_languages': ConfigService.get_supported_languages(),
+    'compliance': ConfigService.AUDIT_CONFIG['compliance_requirements'],
+    'endpoints': {
+        'analytics': '/api/analytics/*',
+        'risk_management': '/api/risk/*',
+        'reporting': '/api/reporting/*',
+        'integration': '/api/integration/*'
+    }
+}
+
+# API information payload is fully static / Payload de informações da API é totalmente estático
+_API_INFO_BYTES = orjson.dumps({
+    'message': 'Construction Hub Financial Advanced Service API',
+    'service': 'financial-advanced',
+    'version': '1.0.0',
+    'frontend_url': _FRONTEND_URL,
+    'documentation': f"{_FRONTEND_URL}/api/docs",
+    'endpoints': {
+        'health': '/health',
+        'frontend_config': '/config/frontend-urls',
+        'analytics': '/api/analytics/*',
+        'risk_management': '/api/risk/*',
+        'reporting': '/api/reporting/*',
+        'integration': '/api/integration/*'
+    },
+    'supported_languages': ConfigService.get_supported_languages(),
+    'compliance': 'SOX, PIPEDA, AODA, FINTRAC compliant'
+})
+
+# Files under the static folder, indexed once / Arquivos da pasta estática, indexados uma vez
+_STATIC_FILES = frozenset(
+    p.relative_to(app.static_folder).as_posix()
+    for p in Path(app.static_folder).rglob('*') if p.is_file()
+) if app.static_folder and os.path.isdir(app.static_folder) else frozenset()
+
+# Database ping result shared across health probes / Resultado do ping do banco compartilhado entre verificações
+_DB_PING_TTL_SECONDS = ConfigService.PERFORMANCE_CONFIG['health_check_cache_seconds']
+_last_db_ping = float('-inf')
+_last_db_status = None
+
+def _check_database():
+    """
+    Ping the database at most once per TTL window
+    Verificar o banco de dados no máximo uma vez por janela de TTL
+    """
+    global _last_db_ping, _last_db_status
+    now = time.monotonic()
+    if now - _last_db_ping < _DB_PING_TTL_SECONDS:
+        return _last_db_status
+    
+    try:
+        db.session.execute(text('SELECT 1'))
+        db_status = 'healthy'
+    except Exception as e:
+        db_status = f'unhealthy: {str(e)}'
+        logger.error(f"Database health check failed / Verificação de saúde do banco de dados falhou: {str(e)}")
+    
+    _last_db_ping = now
+    _last_db_status = db_status
+    return db_status
+
 @app.before_request
 def before_request():
     """
@@ -94,16 +200,29 @@ def before_request():
     """
     # Set request start time for performance monitoring
     # Definir tempo de início da requisição para monitoramento de performance
-    g.request_start_time = datetime.utcnow()
+    g.request_start_ns = time.perf_counter_ns()
     
     # Extract user information from headers (set by authentication service)
     # Extrair informações do usuário dos cabeçalhos (definido pelo serviço de autenticação)
-    g.user_id = request.headers.get('X-User-ID', 'anonymous')
-    g.user_email = request.headers.get('X-User-Email')
-    g.session_id = request.headers.get('X-Session-ID')
+    headers = request.headers
+    g.user_id = headers.get('X-User-ID', 'anonymous')
+    g.user_email = headers.get('X-User-Email')
+    g.session_id = headers.get('X-Session-ID')
+    
+    # Resolve the request fields audit entries need once, keyed by AuditLog column
+    # Resolver uma vez os campos da requisição usados pela auditoria, por coluna do AuditLog
+    g._audit_ctx = {
+        'user_id': g.user_id,
+        'user_email': g.user_email,
+        'session_id': g.session_id,
+        'ip_address': request.remote_addr,
+        'user_agent': headers.get('User-Agent'),
+        'http_method': request.method,
+        'endpoint': request.endpoint
+    }
     
     # Log request if audit is enabled / Registrar requisição se auditoria estiver habilitada
-    if ConfigService.is_audit_enabled() and ConfigService.AUDIT_CONFIG['log_all_requests']:
+    if _AUDIT_ENABLED and _LOG_ALL_REQUESTS:
         logger.info(f"Request: {request.method} {request.endpoint} from {request.remote_addr}")
 
 @app.after_request
@@ -113,9 +232,9 @@ def after_request(response):
     Processamento pós-requisição para auditoria e monitoramento de performance
     """
     # Calculate request processing time / Calcular tempo de processamento da requisição
-    if hasattr(g, 'request_start_time'):
-        processing_time = (datetime.utcnow() - g.request_start_time).total_seconds() * 1000
-        response.headers['X-Processing-Time-Ms'] = str(int(processing_time))
+    if hasattr(g, 'request_start_ns'):
+        processing_time_ms = (time.perf_counter_ns() - g.request_start_ns) // 1_000_000
+        response.headers['X-Processing-Time-Ms'] = str(processing_time_ms)
     
     # Add security headers / Adicionar cabeçalhos de segurança
     response.headers['X-Content-Type-Options'] = 'nosniff'
@@ -124,7 +243,7 @@ def after_request(response):
     
     # Add frontend URL to response headers for client configuration
     # Adicionar URL do frontend aos cabeçalhos de resposta para configuração do cliente
-    response.headers['X-Frontend-Base-URL'] = ConfigService.FRONTEND_BASE_URL
+    response.headers['X-Frontend-Base-URL'] = _FRONTEND_URL
     
     return response
 
@@ -135,41 +254,15 @@ def health_check():
     Health check endpoint with comprehensive system status
     Endpoint de verificação de saúde com status abrangente do sistema
     """
-    try:
-        # Check database connectivity / Verificar conectividade do banco de dados
-        db.session.execute('SELECT 1')
-        db_status = 'healthy'
-    except Exception as e:
-        db_status = f'unhealthy: {str(e)}'
-        logger.error(f"Database health check failed / Verificação de saúde do banco de dados falhou: {str(e)}")
+    # Check database connectivity / Verificar conectividade do banco de dados
+    db_status = _check_database()
     
-    health_data = {
-        'status': 'healthy' if db_status == 'healthy' else 'degraded',
-        'service': 'Construction Hub Financial Advanced Service',
-        'version': '1.0.0',
-        'timestamp': datetime.utcnow().isoformat(),
-        'frontend_base_url': ConfigService.FRONTEND_BASE_URL,
-        'database_status': db_status,
-        'features': [
-            'Advanced Financial Analytics / Análise Financeira Avançada',
-            'Risk Management System / Sistema de Gerenciamento de Riscos',
-            'Financial Reporting Advanced / Relatórios Financeiros Avançados',
-            'Integration Hub / Hub de Integração',
-            'Real-time Monitoring / Monitoramento em Tempo Real',
-            'Canadian Banking Integration / Integração Bancária Canadense',
-            'Audit Trail System / Sistema de Trilha de Auditoria'
-        ],
-        'supported_languages': ConfigService.get_supported_languages(),
-        'compliance': ConfigService.AUDIT_CONFIG['compliance_requirements'],
-        'endpoints': {
-            'analytics': '/api/analytics/*',
-            'risk_management': '/api/risk/*',
-            'reporting': '/api/reporting/*',
-            'integration': '/api/integration/*'
-        }
-    }
+    health_data = _HEALTH_TEMPLATE.copy()
+    health_data['status'] = 'healthy' if db_status == 'healthy' else 'degraded'
+    health_data['timestamp'] = datetime.utcnow().isoformat()
+    health_data['database_status'] = db_status
     
-    return jsonify(health_data)
+    return app.response_class(orjson.dumps(health_data), mimetype='application/json')
 
 @app.route('/config/frontend-urls')
 @audit_required(action='GET_CONFIG', resource_type='configuration', risk_level='LOW')
@@ -195,29 +288,18 @@ def serve(path):
     """
     static_folder_path = app.static_folder
     if static_folder_path is None:
-        return jsonify({
-            'message': 'Construction Hub Financial Advanced Service API',
-            'service': 'financial-advanced',
-            'version': '1.0.0',
-            'frontend_url': ConfigService.FRONTEND_BASE_URL,
-            'documentation': f"{ConfigService.FRONTEND_BASE_URL}/api/docs",
-            'endpoints': {
-                'health': '/health',
-                'frontend_config': '/config/frontend-urls',
-                'analytics': '/api/analytics/*',
-                'risk_management': '/api/risk/*',
-                'reporting': '/api/reporting/*',
-                'integration': '/api/integration/*'
-            },
-            'supported_languages': ConfigService.get_supported_languages(),
-            'compliance': 'SOX, PIPEDA, AODA, FINTRAC compliant'
-        })
-
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
+        return app.response_class(_API_INFO_BYTES, mimetype='application/json')
+
+    # Known files skip the filesystem check / Arquivos conhecidos evitam a verificação no sistema de arquivos
+    if path in _STATIC_FILES:
+        return send_from_directory(static_folder_path, path)
+    
+    # Files added after startup / Arquivos adicionados após a inicialização
+    file_path = safe_join(static_folder_path, path) if path != "" else None
+    if file_path is not None and os.path.isfile(file_path):
         return send_from_directory(static_folder_path, path)
     else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
+        if 'index.html' in _STATIC_FILES or os.path.isfile(os.path.join(static_folder_path, 'index.html')):
             return send_from_directory(static_folder_path, 'index.html')
         else:
             # Redirect to frontend application / Redirecionar para aplicação frontend
@@ -227,6 +309,8 @@ def serve(path):
                 'frontend_url': ConfigService.FRONTEND_BASE_URL
             })
 
+# Development server only; production runs under gunicorn (see gunicorn.conf.py)
+# Apenas servidor de desenvolvimento; produção roda sob gunicorn (veja gunicorn.conf.py)
 if __name__ == '__main__':
     logger.info(f"Starting Financial Advanced Service / Iniciando Serviço Financeiro Avançado")
     logger.info(f"Frontend URL configured: {ConfigService.FRONTEND_BASE_URL}")
@@ -0,0 +1,73 @@
+"""
+Request Schemas for Construction Hub Financial Advanced Service
+Typed JSON bodies for the POST endpoints, validated with pydantic
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+Identifier = Union[str, int]
+
+MAX_BATCH_REQUESTS = 50
+
+
+class SyncFinancialDataRequest(BaseModel):
+    """Body of POST /api/integration/sync/financial-data"""
+    type: str = 'incremental'  # full, incremental
+    services: Union[str, List[str]] = 'all'  # specific services or 'all'
+
+
+class CrossServiceAnalyticsRequest(BaseModel):
+    """Body of POST /api/integration/cross-service/analytics"""
+    type: str = 'correlation'  # correlation, trend, variance
+    services: List[str] = []
+    metrics: List[str] = []
+
+
+class GatewayRouteRequest(BaseModel):
+    """Body of POST /api/integration/api-gateway/route"""
+    service: Optional[str] = None
+    endpoint: Optional[str] = None
+    method: str = 'GET'
+    payload: Any = {}
+
+
+class BatchRouteRequest(BaseModel):
+    """Body of POST /api/integration/api-gateway/route/batch"""
+    requests: List[GatewayRouteRequest] = Field(default=[], max_length=MAX_BATCH_REQUESTS)
+
+
+class ConfigRequest(BaseModel):
+    """Body carrying a free-form configuration object (webhooks, custom and scheduled reports)"""
+    config: Dict[str, Any] = {}
+
+
+class ExportReportRequest(BaseModel):
+    """Body of POST /api/reporting/export"""
+    report_id: Optional[Identifier] = None
+    format: str = 'pdf'  # pdf, excel, csv
+
+
+class ProjectRiskRequest(BaseModel):
+    """Body of POST /api/risk/assess-project"""
+    project_id: Optional[Identifier] = None
+    type: str = 'comprehensive'  # financial, operational, market
+
+
+class CreditScoreRequest(BaseModel):
+    """Body of POST /api/risk/credit-score"""
+    entity_id: Optional[Identifier] = None
+    entity_type: Optional[str] = None  # supplier, customer
+
+
+class StressTestRequest(BaseModel):
+    """Body of POST /api/risk/stress-test"""
+    scenarios: List[str] = ['recession', 'interest_rate_rise', 'material_cost_spike']
+    severity: str = 'moderate'  # mild, moderate, severe
+
+
+class PredictiveRiskRequest(BaseModel):
+    """Body of POST /api/risk/predictive-analysis"""
+    horizon: str = '6months'  # 3months, 6months, 1year
+    categories: List[str] = ['financial', 'operational']
@@ -3,32 +3,41 @@ Analytics Routes - Advanced Financial Analytics
 Provides comprehensive financial analytics and insights for construction companies
 """
 
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request, jsonify
 from src.services.analytics_service import AnalyticsService
 from src.services.profitability_service import ProfitabilityService
 from src.services.kpi_service import KPIService
+from src.utils.cache import cached_view
+from src.utils.json_response import ojsonify
+from src.utils.http import qbool
 
 analytics_bp = Blueprint('analytics', __name__)
 analytics_service = AnalyticsService()
 profitability_service = ProfitabilityService()
 kpi_service = KPIService()
 
+MAX_COMPARE_PROJECTS = 500
+
+_HEALTH_BYTES = orjson.dumps({
+    'status': 'healthy',
+    'module': 'Financial Analytics',
+    'capabilities': [
+        'Financial KPI Calculation',
+        'Project Profitability Analysis',
+        'Revenue Trend Analysis',
+        'Cost Analysis',
+        'Performance Benchmarking'
+    ]
+})
+
 @analytics_bp.route('/health')
 def health():
     """Analytics module health check"""
-    return jsonify({
-        'status': 'healthy',
-        'module': 'Financial Analytics',
-        'capabilities': [
-            'Financial KPI Calculation',
-            'Project Profitability Analysis',
-            'Revenue Trend Analysis',
-            'Cost Analysis',
-            'Performance Benchmarking'
-        ]
-    })
+    return Response(_HEALTH_BYTES, mimetype='application/json')
 
 @analytics_bp.route('/kpis', methods=['GET'])
+@cached_view()
 def get_financial_kpis():
     """Get comprehensive financial KPIs"""
     try:
@@ -51,7 +60,7 @@ def get_profitability_analysis():
     """Get detailed profitability analysis"""
     try:
         project_id = request.args.get('project_id')
-        include_forecast = request.args.get('include_forecast', 'false').lower() == 'true'
+        include_forecast = qbool('include_forecast', False)
         
         analysis = profitability_service.analyze_project_profitability(
             project_id, include_forecast
@@ -66,6 +75,7 @@ def get_profitability_analysis():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @analytics_bp.route('/revenue-trends', methods=['GET'])
+@cached_view()
 def get_revenue_trends():
     """Get revenue trend analysis"""
     try:
@@ -74,7 +84,7 @@ def get_revenue_trends():
         
         trends = analytics_service.analyze_revenue_trends(period, granularity)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': trends,
             'period': period,
@@ -102,6 +112,7 @@ def get_cost_analysis():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @analytics_bp.route('/performance-metrics', methods=['GET'])
+@cached_view()
 def get_performance_metrics():
     """Get performance metrics and benchmarks"""
     try:
@@ -124,11 +135,11 @@ def get_cash_flow_analysis():
     """Get cash flow analysis and patterns"""
     try:
         period = request.args.get('period', '12months')
-        include_forecast = request.args.get('include_forecast', 'true').lower() == 'true'
+        include_forecast = qbool('include_forecast', True)
         
         analysis = analytics_service.analyze_cash_flow(period, include_forecast)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': analysis,
             'period': period,
@@ -141,25 +152,38 @@ def get_cash_flow_analysis():
 def compare_projects():
     """Compare multiple projects across various metrics"""
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data(cache=False) or b'{}')
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'JSON object body required'}), 400
+        
         project_ids = data.get('project_ids', [])
         metrics = data.get('metrics', ['profitability', 'efficiency', 'timeline'])
         
         if not project_ids:
             return jsonify({'success': False, 'error': 'Project IDs required'}), 400
         
+        if (not isinstance(project_ids, list) or len(project_ids) > MAX_COMPARE_PROJECTS
+                or not all(isinstance(project_id, str) for project_id in project_ids)):
+            return jsonify({
+                'success': False,
+                'error': f'project_ids must be a list of at most {MAX_COMPARE_PROJECTS} strings'
+            }), 400
+        
         comparison = analytics_service.compare_projects(project_ids, metrics)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': comparison,
             'projects_compared': len(project_ids),
             'metrics': metrics
         })
+    except orjson.JSONDecodeError:
+        return jsonify({'success': False, 'error': 'Invalid JSON body'}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @analytics_bp.route('/financial-ratios', methods=['GET'])
+@cached_view()
 def get_financial_ratios():
     """Get comprehensive financial ratios"""
     try:
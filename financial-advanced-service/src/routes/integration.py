@@ -3,199 +3,304 @@ Integration Routes - Microservices Integration Hub
 Central integration point for all Construction Hub microservices
 """
 
-from flask import Blueprint, request, jsonify
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import orjson
+from flask import Blueprint, Response, current_app, g, request
 from src.services.integration_service import IntegrationService
 from src.services.data_sync_service import DataSyncService
 from src.services.api_gateway_service import APIGatewayService
+from src.services.config_service import ConfigService
+from src.utils.cache import cached_view, swr_get, tiered_get, tiered_put
+from src.utils.jobs import enqueue_job, fetch_user_job
+from src.utils.json_response import ojsonify
+from src.utils.http import parse_body, qbool, safe_json
+from src.models.request_schemas import (
+    SyncFinancialDataRequest, CrossServiceAnalyticsRequest, GatewayRouteRequest,
+    BatchRouteRequest, ConfigRequest
+)
 
 integration_bp = Blueprint('integration', __name__)
 integration_service = IntegrationService()
-data_sync_service = DataSyncService()
 api_gateway_service = APIGatewayService()
 
+_CACHE_TTL = ConfigService.PERFORMANCE_CONFIG['dashboard_cache_ttl_seconds']
+_SUMMARY_CACHE_TTL = ConfigService.PERFORMANCE_CONFIG['summary_cache_ttl_seconds']
+_CONSISTENCY_FRESH = ConfigService.PERFORMANCE_CONFIG['consistency_fresh_seconds']
+_CONSISTENCY_STALE = ConfigService.PERFORMANCE_CONFIG['consistency_stale_seconds']
+_DATA_FLOW_FRESH = ConfigService.PERFORMANCE_CONFIG['data_flow_fresh_seconds']
+_DATA_FLOW_STALE = ConfigService.PERFORMANCE_CONFIG['data_flow_stale_seconds']
+
+_BATCH_TIMEOUT_SECONDS = ConfigService.PERFORMANCE_CONFIG['request_timeout_seconds']
+_gateway_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='gateway-batch')
+
+def _route_sub_request(app, sub_request):
+    """Route one batched request through the gateway inside an application context"""
+    with app.app_context():
+        return api_gateway_service.route_request(
+            sub_request.service,
+            sub_request.endpoint,
+            sub_request.method,
+            sub_request.payload
+        )
+
+_HEALTH_BYTES = orjson.dumps({
+    'status': 'healthy',
+    'module': 'Integration Hub',
+    'capabilities': [
+        'Microservices Communication',
+        'Data Synchronization',
+        'API Gateway Functions',
+        'Real-time Data Streaming',
+        'Cross-service Analytics'
+    ]
+})
+
 @integration_bp.route('/health')
 def health():
     """Integration module health check"""
-    return jsonify({
-        'status': 'healthy',
-        'module': 'Integration Hub',
-        'capabilities': [
-            'Microservices Communication',
-            'Data Synchronization',
-            'API Gateway Functions',
-            'Real-time Data Streaming',
-            'Cross-service Analytics'
-        ]
-    })
+    return Response(_HEALTH_BYTES, mimetype='application/json')
 
 @integration_bp.route('/microservices/status', methods=['GET'])
+@cached_view(timeout=_CACHE_TTL)
+@safe_json
 def get_microservices_status():
     """Get status of all connected microservices"""
-    try:
-        status = integration_service.get_all_microservices_status()
-        
-        return jsonify({
-            'success': True,
-            'data': status,
-            'total_services': len(status),
-            'healthy_services': len([s for s in status if s.get('status') == 'healthy'])
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    status = integration_service.get_all_microservices_status()
+    total = len(status)
+    healthy = sum(1 for s in status if s.get('status') == 'healthy')
+    
+    return ojsonify({
+        'success': True,
+        'data': status,
+        'total_services': total,
+        'healthy_services': healthy
+    })
 
 @integration_bp.route('/sync/financial-data', methods=['POST'])
+@safe_json
 def sync_financial_data():
     """Synchronize financial data across all microservices"""
-    try:
-        data = request.get_json()
-        sync_type = data.get('type', 'incremental')  # full, incremental
-        services = data.get('services', 'all')  # specific services or 'all'
-        
-        sync_result = data_sync_service.sync_financial_data(sync_type, services)
-        
-        return jsonify({
-            'success': True,
-            'data': sync_result,
-            'sync_type': sync_type,
-            'services_synced': sync_result.get('services_count', 0)
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(SyncFinancialDataRequest)
+    sync_type = body.type
+    services = body.services
+    
+    job = enqueue_job(DataSyncService, 'sync_financial_data', sync_type, services)
+    
+    return ojsonify({
+        'success': True,
+        'job_id': job.id,
+        'sync_type': sync_type,
+        'status_url': f'/api/integration/jobs/{job.id}'
+    }), 202
+
+@integration_bp.route('/jobs/<job_id>', methods=['GET'])
+@safe_json
+def get_job_status(job_id):
+    """Get the status and result of a background job started by the caller"""
+    job = fetch_user_job(job_id, g.user_id)
+    
+    if job is None:
+        return ojsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    status = job.get_status()
+    
+    return ojsonify({
+        'success': True,
+        'job_id': job.id,
+        'status': status,
+        'data': job.return_value() if status == 'finished' else None,
+        'error': 'Job failed' if status == 'failed' else None
+    })
 
 @integration_bp.route('/aggregate/financial-summary', methods=['GET'])
+@safe_json
 def get_aggregated_financial_summary():
     """Get aggregated financial summary from all microservices"""
-    try:
-        period = request.args.get('period', 'current_month')
-        include_forecasts = request.args.get('forecasts', 'true').lower() == 'true'
-        
+    period = request.args.get('period', 'current_month')
+    include_forecasts = qbool('forecasts', True)
+    
+    cache_key = f"fs:{period}:{include_forecasts}"
+    summary = tiered_get(cache_key)
+    if summary is None:
         summary = integration_service.aggregate_financial_summary(period, include_forecasts)
-        
-        return jsonify({
-            'success': True,
-            'data': summary,
-            'period': period,
-            'includes_forecasts': include_forecasts
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        tiered_put(cache_key, summary, _SUMMARY_CACHE_TTL)
+    
+    return ojsonify({
+        'success': True,
+        'data': summary,
+        'period': period,
+        'includes_forecasts': include_forecasts
+    })
 
 @integration_bp.route('/cross-service/analytics', methods=['POST'])
+@safe_json
 def perform_cross_service_analytics():
     """Perform analytics across multiple microservices"""
-    try:
-        data = request.get_json()
-        analysis_type = data.get('type', 'correlation')  # correlation, trend, variance
-        services = data.get('services', [])
-        metrics = data.get('metrics', [])
-        
-        if not services or not metrics:
-            return jsonify({
-                'success': False, 
-                'error': 'Services and metrics required'
-            }), 400
-        
-        analytics = integration_service.perform_cross_service_analytics(
-            analysis_type, services, metrics
-        )
-        
-        return jsonify({
-            'success': True,
-            'data': analytics,
-            'analysis_type': analysis_type,
-            'services_analyzed': len(services)
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(CrossServiceAnalyticsRequest)
+    analysis_type = body.type
+    services = body.services
+    metrics = body.metrics
+    
+    if not services or not metrics:
+        return ojsonify({
+            'success': False, 
+            'error': 'Services and metrics required'
+        }), 400
+    
+    analytics = integration_service.perform_cross_service_analytics(
+        analysis_type, services, metrics
+    )
+    
+    return ojsonify({
+        'success': True,
+        'data': analytics,
+        'analysis_type': analysis_type,
+        'services_analyzed': len(services)
+    })
 
 @integration_bp.route('/data-flow/monitor', methods=['GET'])
+@safe_json
 def monitor_data_flow():
     """Monitor real-time data flow between microservices"""
-    try:
-        time_window = request.args.get('window', '1hour')  # 15min, 1hour, 24hour
-        service_filter = request.args.get('service')
-        
-        flow_data = integration_service.monitor_data_flow(time_window, service_filter)
-        
-        return jsonify({
-            'success': True,
-            'data': flow_data,
-            'time_window': time_window,
-            'service_filter': service_filter
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    time_window = request.args.get('window', '1hour')  # 15min, 1hour, 24hour
+    service_filter = request.args.get('service')
+    
+    flow_data = swr_get(
+        f"flow:{time_window}:{service_filter}",
+        lambda: integration_service.monitor_data_flow(time_window, service_filter),
+        _DATA_FLOW_FRESH,
+        _DATA_FLOW_STALE
+    )
+    
+    return ojsonify({
+        'success': True,
+        'data': flow_data,
+        'time_window': time_window,
+        'service_filter': service_filter
+    })
 
 @integration_bp.route('/api-gateway/route', methods=['POST'])
+@safe_json
 def route_api_request():
     """Route API request through the gateway"""
-    try:
-        data = request.get_json()
-        target_service = data.get('service')
-        endpoint = data.get('endpoint')
-        method = data.get('method', 'GET')
-        payload = data.get('payload', {})
-        
-        if not target_service or not endpoint:
-            return jsonify({
-                'success': False, 
+    body = parse_body(GatewayRouteRequest)
+    target_service = body.service
+    endpoint = body.endpoint
+    method = body.method
+    payload = body.payload
+    
+    if not target_service or not endpoint:
+        return ojsonify({
+            'success': False, 
+            'error': 'Target service and endpoint required'
+        }), 400
+    
+    response = api_gateway_service.route_request(
+        target_service, endpoint, method, payload
+    )
+    
+    return ojsonify({
+        'success': True,
+        'data': response,
+        'target_service': target_service,
+        'endpoint': endpoint
+    })
+
+@integration_bp.route('/api-gateway/route/batch', methods=['POST'])
+@safe_json
+def route_api_request_batch():
+    """Route several API requests through the gateway concurrently"""
+    # BatchRouteRequest caps the batch size; a longer list is rejected with a 400
+    sub_requests = parse_body(BatchRouteRequest).requests
+    
+    if not sub_requests:
+        return ojsonify({'success': False, 'error': 'Requests list required'}), 400
+    
+    app = current_app._get_current_object()
+    futures = [
+        _gateway_executor.submit(_route_sub_request, app, sub_request)
+        if sub_request.service and sub_request.endpoint
+        else None
+        for sub_request in sub_requests
+    ]
+    
+    # Every sub-request shares one deadline; results keep the input order
+    deadline = time.monotonic() + _BATCH_TIMEOUT_SECONDS
+    responses = []
+    for index, future in enumerate(futures):
+        if future is None:
+            responses.append({
+                'index': index,
+                'success': False,
                 'error': 'Target service and endpoint required'
-            }), 400
-        
-        response = api_gateway_service.route_request(
-            target_service, endpoint, method, payload
-        )
+            })
+            continue
         
-        return jsonify({
-            'success': True,
-            'data': response,
-            'target_service': target_service,
-            'endpoint': endpoint
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        try:
+            result = future.result(timeout=max(0, deadline - time.monotonic()))
+            responses.append({
+                'index': index,
+                'success': True,
+                'data': result,
+                'target_service': sub_requests[index].service,
+                'endpoint': sub_requests[index].endpoint
+            })
+        except FutureTimeoutError:
+            future.cancel()
+            responses.append({'index': index, 'success': False, 'error': 'Request timed out'})
+        except Exception as e:
+            responses.append({'index': index, 'success': False, 'error': str(e)})
+    
+    return ojsonify({
+        'success': True,
+        'responses': responses,
+        'total_requests': len(sub_requests)
+    })
 
 @integration_bp.route('/webhooks/register', methods=['POST'])
+@safe_json
 def register_webhook():
     """Register webhook for real-time notifications"""
-    try:
-        data = request.get_json()
-        webhook_config = data.get('config', {})
-        
-        required_fields = ['url', 'events', 'service']
-        if not all(field in webhook_config for field in required_fields):
-            return jsonify({
-                'success': False, 
-                'error': 'Missing required fields: url, events, service'
-            }), 400
-        
-        webhook = integration_service.register_webhook(webhook_config)
-        
-        return jsonify({
-            'success': True,
-            'data': webhook,
-            'webhook_id': webhook.get('webhook_id')
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    webhook_config = parse_body(ConfigRequest).config
+    
+    required_fields = ['url', 'events', 'service']
+    if not all(field in webhook_config for field in required_fields):
+        return ojsonify({
+            'success': False, 
+            'error': 'Missing required fields: url, events, service'
+        }), 400
+    
+    webhook = integration_service.register_webhook(webhook_config)
+    
+    return ojsonify({
+        'success': True,
+        'data': webhook,
+        'webhook_id': webhook.get('webhook_id')
+    })
 
 @integration_bp.route('/data-consistency/check', methods=['GET'])
+@safe_json
 def check_data_consistency():
     """Check data consistency across microservices"""
-    try:
-        scope = request.args.get('scope', 'financial')  # financial, projects, users
-        fix_inconsistencies = request.args.get('fix', 'false').lower() == 'true'
-        
-        consistency_report = integration_service.check_data_consistency(
-            scope, fix_inconsistencies
+    scope = request.args.get('scope', 'financial')  # financial, projects, users
+    fix_inconsistencies = qbool('fix', False)
+    
+    if fix_inconsistencies:
+        # Fixing writes to the other services, so it always runs now
+        consistency_report = integration_service.check_data_consistency(scope, True)
+    else:
+        consistency_report = swr_get(
+            f"consistency:{scope}",
+            lambda: integration_service.check_data_consistency(scope, False),
+            _CONSISTENCY_FRESH,
+            _CONSISTENCY_STALE
         )
-        
-        return jsonify({
-            'success': True,
-            'data': consistency_report,
-            'scope': scope,
-            'auto_fixed': fix_inconsistencies
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    
+    return ojsonify({
+        'success': True,
+        'data': consistency_report,
+        'scope': scope,
+        'auto_fixed': fix_inconsistencies
+    })
 
@@ -3,182 +3,176 @@ Risk Management Routes - Advanced Risk Assessment and Management
 Comprehensive risk management system for construction financial operations
 """
 
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request
 from src.services.risk_service import RiskService
 from src.services.credit_service import CreditService
 from src.services.portfolio_risk_service import PortfolioRiskService
+from src.utils.http import etagged, parse_body, qbool, safe_json
+from src.models.request_schemas import (
+    ProjectRiskRequest, CreditScoreRequest, StressTestRequest, PredictiveRiskRequest
+)
+from src.utils.json_response import ojsonify
 
 risk_bp = Blueprint('risk', __name__)
 risk_service = RiskService()
 credit_service = CreditService()
 portfolio_risk_service = PortfolioRiskService()
 
+_HEALTH_BYTES = orjson.dumps({
+    'status': 'healthy',
+    'module': 'Risk Management',
+    'capabilities': [
+        'Project Risk Assessment',
+        'Credit Risk Scoring',
+        'Portfolio Risk Analysis',
+        'Risk Mitigation Strategies',
+        'Predictive Risk Modeling'
+    ]
+})
+
 @risk_bp.route('/health')
 def health():
     """Risk management module health check"""
-    return jsonify({
-        'status': 'healthy',
-        'module': 'Risk Management',
-        'capabilities': [
-            'Project Risk Assessment',
-            'Credit Risk Scoring',
-            'Portfolio Risk Analysis',
-            'Risk Mitigation Strategies',
-            'Predictive Risk Modeling'
-        ]
-    })
+    return Response(_HEALTH_BYTES, mimetype='application/json')
 
 @risk_bp.route('/assess-project', methods=['POST'])
+@safe_json
 def assess_project_risk():
     """Comprehensive project risk assessment"""
-    try:
-        data = request.get_json()
-        project_id = data.get('project_id')
-        assessment_type = data.get('type', 'comprehensive')  # financial, operational, market
-        
-        if not project_id:
-            return jsonify({'success': False, 'error': 'Project ID required'}), 400
-        
-        assessment = risk_service.assess_project_risk(project_id, assessment_type)
-        
-        return jsonify({
-            'success': True,
-            'data': assessment,
-            'project_id': project_id,
-            'assessment_type': assessment_type
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(ProjectRiskRequest)
+    project_id = body.project_id
+    assessment_type = body.type
+    
+    if not project_id:
+        return ojsonify({'success': False, 'error': 'Project ID required'}), 400
+    
+    assessment = risk_service.assess_project_risk(project_id, assessment_type)
+    
+    return ojsonify({
+        'success': True,
+        'data': assessment,
+        'project_id': project_id,
+        'assessment_type': assessment_type
+    })
 
 @risk_bp.route('/credit-score', methods=['POST'])
+@safe_json
 def calculate_credit_score():
     """Calculate credit score for suppliers/customers"""
-    try:
-        data = request.get_json()
-        entity_id = data.get('entity_id')
-        entity_type = data.get('entity_type')  # supplier, customer
-        
-        if not entity_id or not entity_type:
-            return jsonify({'success': False, 'error': 'Entity ID and type required'}), 400
-        
-        score = credit_service.calculate_credit_score(entity_id, entity_type)
-        
-        return jsonify({
-            'success': True,
-            'data': score,
-            'entity_id': entity_id,
-            'entity_type': entity_type
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(CreditScoreRequest)
+    entity_id = body.entity_id
+    entity_type = body.entity_type
+    
+    if not entity_id or not entity_type:
+        return ojsonify({'success': False, 'error': 'Entity ID and type required'}), 400
+    
+    score = credit_service.calculate_credit_score(entity_id, entity_type)
+    
+    return ojsonify({
+        'success': True,
+        'data': score,
+        'entity_id': entity_id,
+        'entity_type': entity_type
+    })
 
 @risk_bp.route('/portfolio-analysis', methods=['GET'])
+@safe_json
 def get_portfolio_risk_analysis():
     """Get comprehensive portfolio risk analysis"""
-    try:
-        analysis_type = request.args.get('type', 'overall')  # overall, by_category, by_project
-        include_scenarios = request.args.get('scenarios', 'true').lower() == 'true'
-        
-        analysis = portfolio_risk_service.analyze_portfolio_risk(
-            analysis_type, include_scenarios
-        )
-        
-        return jsonify({
-            'success': True,
-            'data': analysis,
-            'analysis_type': analysis_type,
-            'includes_scenarios': include_scenarios
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    analysis_type = request.args.get('type', 'overall')  # overall, by_category, by_project
+    include_scenarios = qbool('scenarios', True)
+    
+    analysis = portfolio_risk_service.analyze_portfolio_risk(
+        analysis_type, include_scenarios
+    )
+    
+    return ojsonify({
+        'success': True,
+        'data': analysis,
+        'analysis_type': analysis_type,
+        'includes_scenarios': include_scenarios
+    })
 
 @risk_bp.route('/risk-alerts', methods=['GET'])
+@etagged
+@safe_json
 def get_risk_alerts():
     """Get current risk alerts and warnings"""
-    try:
-        severity = request.args.get('severity', 'all')  # INFO, WARNING, CRITICAL
-        category = request.args.get('category', 'all')  # financial, operational, market
-        
-        alerts = risk_service.get_risk_alerts(severity, category)
-        
-        return jsonify({
-            'success': True,
-            'data': alerts,
-            'severity_filter': severity,
-            'category_filter': category
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    severity = request.args.get('severity', 'all')  # INFO, WARNING, CRITICAL
+    category = request.args.get('category', 'all')  # financial, operational, market
+    
+    alerts = risk_service.get_risk_alerts(severity, category)
+    
+    return ojsonify({
+        'success': True,
+        'data': alerts,
+        'severity_filter': severity,
+        'category_filter': category
+    })
 
 @risk_bp.route('/mitigation-strategies', methods=['GET'])
+@safe_json
 def get_mitigation_strategies():
     """Get risk mitigation strategies"""
-    try:
-        risk_type = request.args.get('risk_type')
-        risk_level = request.args.get('risk_level')
-        
-        strategies = risk_service.get_mitigation_strategies(risk_type, risk_level)
-        
-        return jsonify({
-            'success': True,
-            'data': strategies,
-            'risk_type': risk_type,
-            'risk_level': risk_level
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    risk_type = request.args.get('risk_type')
+    risk_level = request.args.get('risk_level')
+    
+    strategies = risk_service.get_mitigation_strategies(risk_type, risk_level)
+    
+    return ojsonify({
+        'success': True,
+        'data': strategies,
+        'risk_type': risk_type,
+        'risk_level': risk_level
+    })
 
 @risk_bp.route('/stress-test', methods=['POST'])
+@safe_json
 def perform_stress_test():
     """Perform financial stress testing"""
-    try:
-        data = request.get_json()
-        scenarios = data.get('scenarios', ['recession', 'interest_rate_rise', 'material_cost_spike'])
-        severity = data.get('severity', 'moderate')  # mild, moderate, severe
-        
-        results = risk_service.perform_stress_test(scenarios, severity)
-        
-        return jsonify({
-            'success': True,
-            'data': results,
-            'scenarios': scenarios,
-            'severity': severity
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(StressTestRequest)
+    scenarios = body.scenarios
+    severity = body.severity
+    
+    results = risk_service.perform_stress_test(scenarios, severity)
+    
+    return ojsonify({
+        'success': True,
+        'data': results,
+        'scenarios': scenarios,
+        'severity': severity
+    })
 
 @risk_bp.route('/risk-matrix', methods=['GET'])
+@etagged
+@safe_json
 def get_risk_matrix():
     """Get risk matrix visualization data"""
-    try:
-        scope = request.args.get('scope', 'all')  # all, active_projects, portfolio
-        
-        matrix = risk_service.generate_risk_matrix(scope)
-        
-        return jsonify({
-            'success': True,
-            'data': matrix,
-            'scope': scope
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    scope = request.args.get('scope', 'all')  # all, active_projects, portfolio
+    
+    matrix = risk_service.generate_risk_matrix(scope)
+    
+    return ojsonify({
+        'success': True,
+        'data': matrix,
+        'scope': scope
+    })
 
 @risk_bp.route('/predictive-analysis', methods=['POST'])
+@safe_json
 def get_predictive_risk_analysis():
     """Get predictive risk analysis using ML models"""
-    try:
-        data = request.get_json()
-        prediction_horizon = data.get('horizon', '6months')  # 3months, 6months, 1year
-        risk_categories = data.get('categories', ['financial', 'operational'])
-        
-        predictions = risk_service.predict_future_risks(prediction_horizon, risk_categories)
-        
-        return jsonify({
-            'success': True,
-            'data': predictions,
-            'prediction_horizon': prediction_horizon,
-            'categories': risk_categories
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = parse_body(PredictiveRiskRequest)
+    prediction_horizon = body.horizon
+    risk_categories = body.categories
+    
+    predictions = risk_service.predict_future_risks(prediction_horizon, risk_categories)
+    
+    return ojsonify({
+        'success': True,
+        'data': predictions,
+        'prediction_horizon': prediction_horizon,
+        'categories': risk_categories
+    })
 
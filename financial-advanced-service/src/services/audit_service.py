@@ -9,14 +9,99 @@ Canadian Compliance: SOX, PIPEDA, AODA
 Conformidade Canadense: SOX, PIPEDA, AODA
 """
 
-from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-import json
+import atexit
+import fcntl
+import glob
+import logging
+import os
+import queue
+import struct
+import threading
+import time
 import uuid
+from collections import Counter
 from functools import wraps
-from flask import request, g
+import orjson
+from flask import request, g, has_request_context
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from src.models.financial_models import db
+from src.services.config_service import ConfigService, HIGH_RISK_ACTIONS
+from src.utils.json_provider import json_default
 
-db = SQLAlchemy()
+logger = logging.getLogger(__name__)
+
+# Pending audit events; new events are dropped and reported when full so requests never wait
+# Eventos de auditoria pendentes; novos eventos são descartados e reportados quando cheio
+_audit_queue = queue.Queue(maxsize=ConfigService.AUDIT_CONFIG['queue_max_size'])
+_audit_writer = None
+
+# Write-ahead log: each process appends length-prefixed frames to its own segment file (locked while alive);
+# the writer starts a new segment for every batch and removes a segment once all its events reach the database
+# Log de escrita antecipada: cada processo anexa quadros prefixados pelo tamanho ao seu próprio segmento
+# (bloqueado enquanto vivo); o gravador inicia um novo segmento a cada lote e remove um segmento quando
+# todos os seus eventos chegam ao banco
+_WAL_DIR = ConfigService.AUDIT_CONFIG['wal_dir']
+_WAL_FRAME_HEADER = struct.Struct('>I')
+_wal_segment = None
+_wal_lock = threading.Lock()
+
+# Longest request body kept in an audit entry / Maior corpo de requisição mantido em uma entrada de auditoria
+_MAX_REQUEST_PAYLOAD = 64 * 1024
+_LOG_REQUEST_BODY = ConfigService.AUDIT_CONFIG['log_request_body']
+
+# Context used outside a request, e.g. background jobs / Contexto usado fora de uma requisição, ex.: tarefas em segundo plano
+_EMPTY_AUDIT_CTX = {
+    'user_id': 'system',
+    'user_email': None,
+    'session_id': None,
+    'ip_address': None,
+    'user_agent': None,
+    'http_method': None,
+    'endpoint': None
+}
+
+_DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+def _request_payload():
+    """
+    Bounded text record of the request body
+    Registro em texto limitado do corpo da requisição
+    """
+    # Most audited requests (GET, health checks) carry no body / A maioria das requisições auditadas não tem corpo
+    content_length = request.content_length
+    if not content_length and 'chunked' not in request.headers.get('Transfer-Encoding', ''):
+        return None
+    
+    # Uploads are recorded by size only, reading them would buffer the whole file
+    # Uploads são registrados apenas pelo tamanho, lê-los carregaria o arquivo inteiro
+    if request.mimetype == 'multipart/form-data':
+        return f"<multipart/form-data: {content_length or 0} bytes>"
+    
+    # Reuse the body if the handler already buffered it, otherwise read only the prefix
+    # Reutiliza o corpo se o handler já o carregou, senão lê apenas o prefixo
+    data = getattr(request, '_cached_data', None)
+    if data is None:
+        data = request.stream.read(_MAX_REQUEST_PAYLOAD)
+    return data[:_MAX_REQUEST_PAYLOAD].decode('utf-8', 'replace') or None
+
+def _uuid7():
+    """
+    Time-ordered UUID (version 7): 48-bit Unix milliseconds followed by random bits
+    UUID ordenado por tempo (versão 7): milissegundos Unix de 48 bits seguidos de bits aleatórios
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76  # Version / Versão
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant / Variante RFC 4122
+    return uuid.UUID(int=value)
+
+def _dumps(obj):
+    """
+    Serialize an audit payload to a JSON string
+    Serializar um payload de auditoria para uma string JSON
+    """
+    return orjson.dumps(obj, default=json_default, option=_DUMPS_OPTIONS).decode()
 
 class AuditLog(db.Model):
     """
@@ -24,8 +109,15 @@ class AuditLog(db.Model):
     Entradas de log de auditoria para todas as operações do sistema
     """
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Match the get_audit_trail filters, newest first / Correspondem aos filtros de get_audit_trail, mais recentes primeiro
+        db.Index('ix_audit_resource_ts', 'resource_type', 'resource_id', 'timestamp'),
+        db.Index('ix_audit_user_ts', 'user_id', 'timestamp'),
+        db.Index('ix_audit_ts', 'timestamp'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Time-ordered so inserts append to the primary key index / Ordenado por tempo para que inserções anexem ao índice da chave primária
+    id = db.Column(db.BINARY(16), primary_key=True, default=lambda: _uuid7().bytes)
     
     # User and session information / Informações do usuário e sessão
     user_id = db.Column(db.String(50), nullable=False)
@@ -56,7 +148,7 @@ class AuditLog(db.Model):
     # Business context / Contexto de negócio
     business_context = db.Column(db.Text)  # Additional business information / Informações adicionais de negócio
     risk_level = db.Column(db.String(20), default='LOW')  # LOW, MEDIUM, HIGH, CRITICAL
-    compliance_flags = db.Column(db.Text)  # JSON array of compliance requirements / Array JSON de requisitos de conformidade
+    compliance_flags = db.Column(db.JSON(none_as_null=True))  # Array of compliance requirements / Array de requisitos de conformidade
     
     # Timing / Temporização
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -65,110 +157,439 @@ class AuditLog(db.Model):
     # Status and metadata / Status e metadados
     status = db.Column(db.String(20), default='SUCCESS')  # SUCCESS, FAILURE, WARNING
     error_message = db.Column(db.Text)
-    metadata = db.Column(db.Text)  # Additional metadata as JSON / Metadados adicionais como JSON
+    # 'metadata' is reserved on declarative models; the attribute is renamed, the column keeps its name
+    # 'metadata' é reservado em modelos declarativos; o atributo é renomeado, a coluna mantém o nome
+    extra_metadata = db.Column('metadata', db.JSON(none_as_null=True))  # Additional metadata / Metadados adicionais
     
     # Retention and archival / Retenção e arquivamento
     retention_period_days = db.Column(db.Integer, default=2555)  # 7 years default / 7 anos padrão
     archived = db.Column(db.Boolean, default=False)
     archived_at = db.Column(db.DateTime)
 
-class AuditService:
+_AUDIT_INSERT = AuditLog.__table__.insert()
+
+class _WalSegment:
     """
-    Service for managing audit operations
-    Serviço para gerenciar operações de auditoria
+    One write-ahead log file and the number of its events not yet stored
+    Um arquivo do log de escrita antecipada e o número de seus eventos ainda não gravados
     """
+    __slots__ = ('fd', 'path', 'pending', 'sealed')
     
-    @staticmethod
-    def log_action(action, resource_type, resource_id=None, old_values=None, new_values=None, 
-                   business_context=None, risk_level='LOW', compliance_flags=None):
-        """
-        Log an audit action
-        Registrar uma ação de auditoria
-        
-        Args:
-            action (str): Action performed / Ação realizada
-            resource_type (str): Type of resource / Tipo de recurso
-            resource_id (str): ID of the resource / ID do recurso
-            old_values (dict): Previous values / Valores anteriores
-            new_values (dict): New values / Novos valores
-            business_context (str): Business context / Contexto de negócio
-            risk_level (str): Risk level / Nível de risco
-            compliance_flags (list): Compliance requirements / Requisitos de conformidade
-        """
+    def __init__(self, fd, path):
+        self.fd = fd
+        self.path = path
+        self.pending = 0
+        self.sealed = False  # No longer appended to / Não recebe mais anexos
+
+def _create_wal_segment():
+    """
+    Create and lock a new log segment for this process
+    Criar e bloquear um novo segmento de log para este processo
+    """
+    # Create and lock the file under a name the replay glob ignores, then rename it into place,
+    # so no other process can ever see it unlocked; the random suffix rules out PID reuse
+    # Criar e bloquear o arquivo com um nome ignorado pelo glob de reprocessamento e depois renomeá-lo,
+    # para que nenhum outro processo o veja desbloqueado; o sufixo aleatório evita reuso de PID
+    name = f'audit-{os.getpid()}-{uuid.uuid4().hex}'
+    temp_path = os.path.join(_WAL_DIR, f'.{name}.tmp')
+    path = os.path.join(_WAL_DIR, f'{name}.wal')
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND, 0o600)
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    os.rename(temp_path, path)
+    return _WalSegment(fd, path)
+
+def _wal_append(event):
+    """
+    Append one event frame to this process's write-ahead log; returns the segment holding it
+    Anexar um quadro de evento ao log de escrita antecipada deste processo; retorna o segmento que o contém
+    """
+    frame = orjson.dumps(
+        {**event, 'id': str(uuid.UUID(bytes=event['id']))}, default=json_default, option=_DUMPS_OPTIONS
+    )
+    with _wal_lock:
+        segment = _wal_segment
+        os.write(segment.fd, _WAL_FRAME_HEADER.pack(len(frame)) + frame)
+        segment.pending += 1
+    return segment
+
+def _wal_rotate():
+    """
+    Seal the current log segment and continue in a new one, so the sealed one can be removed
+    once its events are stored even while new events keep arriving
+    Selar o segmento de log atual e continuar em um novo, para que o selado possa ser removido
+    quando seus eventos forem gravados mesmo com novos eventos chegando
+    """
+    global _wal_segment
+    with _wal_lock:
+        if _wal_segment.pending == 0:
+            return  # Nothing outstanding, keep appending here / Nada pendente, continuar anexando aqui
         try:
-            # Get request context / Obter contexto da requisição
-            user_id = getattr(g, 'user_id', 'system')
-            user_email = getattr(g, 'user_email', None)
-            session_id = getattr(g, 'session_id', None)
-            
-            # Create audit log entry / Criar entrada de log de auditoria
-            audit_log = AuditLog(
-                user_id=user_id,
-                user_email=user_email,
-                session_id=session_id,
-                ip_address=request.remote_addr if request else None,
-                user_agent=request.headers.get('User-Agent') if request else None,
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                service_name='financial-advanced',
-                http_method=request.method if request else None,
-                endpoint=request.endpoint if request else None,
-                request_payload=json.dumps(request.get_json()) if request and request.get_json() else None,
-                old_values=json.dumps(old_values) if old_values else None,
-                new_values=json.dumps(new_values) if new_values else None,
-                business_context=business_context,
-                risk_level=risk_level,
-                compliance_flags=json.dumps(compliance_flags) if compliance_flags else None,
-                status='SUCCESS'
-            )
-            
-            db.session.add(audit_log)
-            db.session.commit()
-            
-            return audit_log.id
+            segment = _create_wal_segment()
+        except OSError as e:
+            # Keep appending to the current segment / Continuar anexando ao segmento atual
+            logger.warning(f"Audit log rotation failed: {str(e)}")
+            return
+        _wal_segment.sealed = True
+        _wal_segment = segment
+
+def _wal_release(counts):
+    """
+    Mark events as stored, per segment; a sealed segment is removed and the current one
+    emptied once none of their events are outstanding
+    Marcar eventos como gravados, por segmento; um segmento selado é removido e o atual
+    esvaziado quando nenhum de seus eventos estiver pendente
+    """
+    with _wal_lock:
+        for segment, count in counts.items():
+            segment.pending -= count
+            if segment.pending:
+                continue
+            if segment.sealed:
+                # Unlink before closing, so the file is never seen unlocked / Remover antes de fechar, para que o arquivo nunca seja visto desbloqueado
+                os.unlink(segment.path)
+                os.close(segment.fd)
+            else:
+                os.ftruncate(segment.fd, 0)
+
+def _read_wal_frames(wal):
+    """
+    Decode the events in a write-ahead log one frame at a time, ignoring a torn final frame
+    Decodificar os eventos de um log de escrita antecipada um quadro por vez, ignorando um quadro final incompleto
+    """
+    while True:
+        header = wal.read(_WAL_FRAME_HEADER.size)
+        if len(header) < _WAL_FRAME_HEADER.size:
+            return
+        (size,) = _WAL_FRAME_HEADER.unpack(header)
+        frame = wal.read(size)
+        if len(frame) < size:
+            return
+        event = orjson.loads(frame)
+        event['id'] = uuid.UUID(event['id']).bytes
+        event['timestamp'] = datetime.fromisoformat(event['timestamp']).replace(tzinfo=None)
+        yield event
+
+def _replay_batch(app, batch):
+    """
+    Insert one batch of replayed events, skipping rows that are already stored
+    Inserir um lote de eventos reprocessados, ignorando linhas já gravadas
+    """
+    with app.app_context():
+        with db.engine.begin() as connection:
+            # A segment can hold events that were stored before its process stopped; only the
+            # single replaying process inserts these ids, so a lookup is a safe guard on any database
+            # Um segmento pode conter eventos gravados antes de seu processo parar; apenas o único
+            # processo de reprocessamento insere esses ids, então uma consulta é uma proteção segura em qualquer banco
+            stored = set(connection.scalars(
+                select(AuditLog.id).where(AuditLog.id.in_([event['id'] for event in batch]))
+            ))
             
+            # Rows in one executemany must share their keys / Linhas em um executemany devem ter as mesmas chaves
+            groups = {}
+            for event in batch:
+                if event['id'] not in stored:
+                    groups.setdefault(frozenset(event), []).append(event)
+            for group in groups.values():
+                connection.execute(_AUDIT_INSERT, group)
+
+def _replay_wal_file(app, path):
+    """
+    Insert the events left in a write-ahead log by a process that is gone, then remove it
+    Inserir os eventos deixados em um log de escrita antecipada por um processo encerrado, depois removê-lo
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Owned by a live process / Pertence a um processo vivo
+        if os.fstat(fd).st_nlink == 0:
+            return  # Removed by its owner after being stored / Removido pelo dono após ser gravado
+        
+        # Stream the log in batches, each in its own transaction; replay is idempotent,
+        # so a failure part way through only repeats the committed batches next time
+        # Ler o log em lotes, cada um em sua própria transação; o reprocessamento é idempotente,
+        # então uma falha no meio apenas repete os lotes já gravados na próxima vez
+        batch_size = ConfigService.AUDIT_CONFIG['batch_size']
+        replayed = 0
+        batch = []
+        with open(fd, 'rb', closefd=False) as wal:
+            for event in _read_wal_frames(wal):
+                batch.append(event)
+                if len(batch) >= batch_size:
+                    _replay_batch(app, batch)
+                    replayed += len(batch)
+                    batch = []
+        if batch:
+            _replay_batch(app, batch)
+            replayed += len(batch)
+        
+        os.unlink(path)
+        if replayed:
+            logger.info(f"Replayed {replayed} audit events from {path}")
+    except Exception:
+        logger.exception(f"Audit log replay failed for {path}, keeping it for the next start")
+    finally:
+        os.close(fd)
+
+def _replay_wal_files(app):
+    """
+    Replay the logs of processes that are gone; one process at a time does this, the others skip it
+    Reprocessar os logs de processos encerrados; um processo por vez faz isso, os outros o ignoram
+    """
+    fd = os.open(os.path.join(_WAL_DIR, '.replay.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Another worker is replaying / Outro worker está reprocessando
+        for path in glob.glob(os.path.join(_WAL_DIR, 'audit-*.wal')):
+            _replay_wal_file(app, path)
+    finally:
+        os.close(fd)
+
+def _open_wal(app):
+    """
+    Open this process's own log; logs left by earlier processes are replayed by the writer thread
+    Abrir o log deste processo; logs deixados por processos anteriores são reprocessados pela thread gravadora
+    """
+    global _wal_segment
+    os.makedirs(_WAL_DIR, exist_ok=True)
+    _wal_segment = _create_wal_segment()
+
+def _write_audit_batches(app):
+    """
+    Drain queued audit events into the database in batches
+    Drenar eventos de auditoria enfileirados para o banco de dados em lotes
+    """
+    batch_size = ConfigService.AUDIT_CONFIG['batch_size']
+    flush_interval = ConfigService.AUDIT_CONFIG['flush_interval_seconds']
+    
+    # Replay off the startup path; this process's own segments are locked and skipped
+    # Reprocessar fora do caminho de inicialização; os segmentos deste processo estão bloqueados e são ignorados
+    if _wal_segment is not None:
+        _replay_wal_files(app)
+    
+    while True:
+        # Wait for the first event, then collect until the batch is full or the interval ends
+        # Aguardar o primeiro evento, depois coletar até o lote encher ou o intervalo terminar
+        batch = [_audit_queue.get()]
+        deadline = time.monotonic() + flush_interval
+        while len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        # New events go to a fresh segment, the ones in this batch can then be removed with it
+        # Novos eventos vão para um segmento novo, os deste lote podem então ser removidos com ele
+        if _wal_segment is not None:
+            _wal_rotate()
+        
+        # Retry the batch while the database is unreachable; meanwhile the bounded queue fills
+        # and new events are dropped instead of piling up in memory
+        # Repetir o lote enquanto o banco estiver inacessível; enquanto isso a fila limitada enche
+        # e novos eventos são descartados em vez de se acumularem na memória
+        while not _flush_audit_batch(app, batch):
+            time.sleep(flush_interval)
+
+def _flush_audit_batch(app, batch):
+    """
+    Insert one batch of audit events in a single transaction; returns False when it should be retried
+    Inserir um lote de eventos de auditoria em uma única transação; retorna False quando deve ser repetido
+    """
+    segments = Counter(segment for segment, _ in batch if segment is not None)
+    for segment in segments:
+        # Group commit: one sync per segment covers every frame in the batch / Commit em grupo: uma sincronização por segmento cobre todos os quadros do lote
+        try:
+            os.fdatasync(segment.fd)
+        except OSError as e:
+            # The database insert still goes ahead / A inserção no banco continua
+            logger.warning(f"Audit log sync failed: {str(e)}")
+    
+    with app.app_context():
+        try:
+            # Core executemany on its own connection, no ORM session involved
+            # executemany do Core em conexão própria, sem sessão do ORM
+            with db.engine.begin() as connection:
+                connection.execute(_AUDIT_INSERT, [event for _, event in batch])
+        except OperationalError as e:
+            # Database unreachable: the caller retries the same batch / Banco inacessível: o chamador repete o mesmo lote
+            logger.warning(f"Audit batch write failed ({len(batch)} events), will retry: {str(e)}")
+            return False
         except Exception as e:
-            # Log the error but don't fail the main operation
-            # Registrar o erro mas não falhar a operação principal
-            print(f"Audit logging failed: {str(e)}")
-            return None
-    
-    @staticmethod
-    def log_error(action, resource_type, error_message, resource_id=None):
-        """
-        Log an error action
-        Registrar uma ação de erro
-        """
-        return AuditService.log_action(
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            business_context=f"Error occurred: {error_message}",
-            risk_level='HIGH'
+            # Rejected rows would fail on every retry, so they are reported and released
+            # Linhas rejeitadas falhariam em toda repetição, então são reportadas e liberadas
+            logger.error(f"Audit batch rejected ({len(batch)} events): {str(e)}")
+    
+    if segments:
+        _wal_release(segments)
+    return True
+
+def _drain_audit_queue(app):
+    """
+    Write whatever is still queued when the process exits
+    Gravar o que ainda estiver enfileirado quando o processo terminar
+    """
+    batch_size = ConfigService.AUDIT_CONFIG['batch_size']
+    batch = []
+    while True:
+        try:
+            batch.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+        if len(batch) >= batch_size:
+            if not _flush_audit_batch(app, batch):
+                return  # Left in the write-ahead log for the next start / Deixado no log para o próximo início
+            batch = []
+    if batch:
+        _flush_audit_batch(app, batch)
+
+def init_app(app):
+    """
+    Start the background audit writer for the application
+    Iniciar o gravador de auditoria em segundo plano para a aplicação
+    """
+    global _audit_writer
+    if _audit_writer is None or not _audit_writer.is_alive():
+        if _WAL_DIR and _wal_segment is None:
+            _open_wal(app)
+        _audit_writer = threading.Thread(
+            target=_write_audit_batches, args=(app,), name='audit-writer', daemon=True
         )
+        _audit_writer.start()
+        atexit.register(_drain_audit_queue, app)
+
+def log_action(action, resource_type, resource_id=None, old_values=None, new_values=None, 
+               business_context=None, risk_level='LOW', compliance_flags=None,
+               processing_time_ms=None):
+    """
+    Queue an audit action for the background writer
+    Enfileirar uma ação de auditoria para o gravador em segundo plano
     
-    @staticmethod
-    def get_audit_trail(resource_type=None, resource_id=None, user_id=None, 
-                       start_date=None, end_date=None, limit=100):
-        """
-        Get audit trail with filters
-        Obter trilha de auditoria com filtros
-        """
-        query = AuditLog.query
+    Args:
+        action (str): Action performed / Ação realizada
+        resource_type (str): Type of resource / Tipo de recurso
+        resource_id (str): ID of the resource / ID do recurso
+        old_values (dict): Previous values / Valores anteriores
+        new_values (dict): New values / Novos valores
+        business_context (str): Business context / Contexto de negócio
+        risk_level (str): Risk level / Nível de risco
+        compliance_flags (list): Compliance requirements / Requisitos de conformidade
+        processing_time_ms (int): Handler duration / Duração do handler
+    """
+    try:
+        # Get request context resolved in before_request / Obter contexto da requisição resolvido em before_request
+        in_request = has_request_context()
+        ctx = getattr(g, '_audit_ctx', _EMPTY_AUDIT_CTX) if in_request else _EMPTY_AUDIT_CTX
+        
+        # High-risk actions are never recorded below HIGH / Ações de alto risco nunca são registradas abaixo de HIGH
+        if action in HIGH_RISK_ACTIONS and risk_level in ('LOW', 'MEDIUM'):
+            risk_level = 'HIGH'
         
-        if resource_type:
-            query = query.filter(AuditLog.resource_type == resource_type)
-        if resource_id:
-            query = query.filter(AuditLog.resource_id == resource_id)
-        if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
-        if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
-        if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
+        # Capture the entry now, the insert happens in a later batch
+        # Capturar a entrada agora, a inserção ocorre em um lote posterior
+        audit_id = _uuid7()
+        event = {
+            **ctx,
+            'id': audit_id.bytes,
+            'action': action,
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'service_name': 'financial-advanced',
+            'old_values': _dumps(old_values) if old_values else None,
+            'new_values': _dumps(new_values) if new_values else None,
+            'business_context': business_context,
+            'risk_level': risk_level,
+            'compliance_flags': list(compliance_flags) if compliance_flags else None,
+            'timestamp': datetime.utcnow(),
+            'processing_time_ms': processing_time_ms,
+            'status': 'SUCCESS'
+        }
         
-        return query.order_by(AuditLog.timestamp.desc()).limit(limit).all()
+        # Leave disabled payload columns out of the insert entirely; every event in a batch
+        # must carry the same keys, so the key depends only on configuration
+        # Deixar colunas de payload desabilitadas fora da inserção; todos os eventos de um lote
+        # devem ter as mesmas chaves, então a chave depende apenas da configuração
+        if _LOG_REQUEST_BODY:
+            event['request_payload'] = _request_payload() if in_request else None
+        
+        # Queued with the log segment holding it / Enfileirado com o segmento de log que o contém
+        segment = _wal_append(event) if _wal_segment is not None else None
+        _audit_queue.put_nowait((segment, event))
+        
+        return str(audit_id)
+        
+    except queue.Full:
+        # The writer will never see this event, so it must not keep the log from being truncated
+        # O gravador nunca verá este evento, então ele não deve impedir o truncamento do log
+        if segment is not None:
+            _wal_release({segment: 1})
+        logger.warning(f"Audit queue full, dropped {action} event on {resource_type}")
+        return None
+    except Exception as e:
+        # Log the error but don't fail the main operation
+        # Registrar o erro mas não falhar a operação principal
+        logger.error(f"Audit logging failed: {str(e)}")
+        return None
+
+def log_error(action, resource_type, error_message, resource_id=None, processing_time_ms=None):
+    """
+    Log an error action
+    Registrar uma ação de erro
+    """
+    return log_action(
+        action=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        business_context=f"Error occurred: {error_message}",
+        risk_level='HIGH',
+        processing_time_ms=processing_time_ms
+    )
+
+def get_audit_trail(resource_type=None, resource_id=None, user_id=None, 
+                   start_date=None, end_date=None, limit=100):
+    """
+    Get audit trail with filters
+    Obter trilha de auditoria com filtros
+    """
+    # Filter values and the limit are bound parameters, so each combination of filters
+    # compiles once and is reused from SQLAlchemy's statement cache
+    # Valores de filtro e o limite são parâmetros, então cada combinação de filtros
+    # é compilada uma vez e reutilizada do cache de instruções do SQLAlchemy
+    stmt = select(AuditLog)
+    
+    if resource_type:
+        stmt = stmt.where(AuditLog.resource_type == resource_type)
+    if resource_id:
+        stmt = stmt.where(AuditLog.resource_id == resource_id)
+    if user_id:
+        stmt = stmt.where(AuditLog.user_id == user_id)
+    if start_date:
+        stmt = stmt.where(AuditLog.timestamp >= start_date)
+    if end_date:
+        stmt = stmt.where(AuditLog.timestamp <= end_date)
+    
+    return db.session.scalars(stmt.order_by(AuditLog.timestamp.desc()).limit(limit)).all()
+
+class AuditService:
+    """
+    Service for managing audit operations
+    Serviço para gerenciar operações de auditoria
+    
+    Facade over the module-level functions, kept for existing callers
+    Fachada sobre as funções do módulo, mantida para chamadores existentes
+    """
+    init_app = staticmethod(init_app)
+    log_action = staticmethod(log_action)
+    log_error = staticmethod(log_error)
+    get_audit_trail = staticmethod(get_audit_trail)
 
 def audit_required(action=None, resource_type=None, risk_level='LOW'):
     """
@@ -183,31 +604,33 @@ def audit_required(action=None, resource_type=None, risk_level='LOW'):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            start_time = datetime.utcnow()
+            start_ns = time.monotonic_ns()
             
             try:
                 # Execute the function / Executar a função
                 result = f(*args, **kwargs)
                 
                 # Calculate processing time / Calcular tempo de processamento
-                processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+                processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
                 
                 # Log successful action / Registrar ação bem-sucedida
-                AuditService.log_action(
+                log_action(
                     action=action or f.__name__.upper(),
                     resource_type=resource_type or 'unknown',
                     business_context=f"Function {f.__name__} executed successfully",
-                    risk_level=risk_level
+                    risk_level=risk_level,
+                    processing_time_ms=processing_time_ms
                 )
                 
                 return result
                 
             except Exception as e:
                 # Log failed action / Registrar ação falhada
-                AuditService.log_error(
+                log_error(
                     action=action or f.__name__.upper(),
                     resource_type=resource_type or 'unknown',
-                    error_message=str(e)
+                    error_message=str(e),
+                    processing_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000
                 )
                 raise
         
@@ -10,7 +10,36 @@ Padrões Canadenses: Segue padrões de TI do governo canadense
 """
 
 import os
-from typing import Dict, Any
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+def _freeze(value):
+    """
+    Make configuration read-only: dicts become MappingProxyType views and lists become tuples
+    Tornar a configuração somente leitura: dicts viram visões MappingProxyType e listas viram tuplas
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Returned for unknown services / Retornado para serviços desconhecidos
+_EMPTY_CONFIG = MappingProxyType({})
+
+# Actions always audited as high risk / Ações sempre auditadas como alto risco
+HIGH_RISK_ACTIONS = frozenset({
+    'DELETE', 'TRANSFER_FUNDS', 'APPROVE_PAYMENT',
+    'MODIFY_BUDGET', 'CHANGE_PERMISSIONS'
+})
+
+# Weekday numbers as returned by date.weekday() / Números dos dias da semana conforme date.weekday()
+_WEEKDAYS = {
+    'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
+    'Friday': 4, 'Saturday': 5, 'Sunday': 6
+}
 
 class ConfigService:
     """
@@ -22,7 +51,7 @@ class ConfigService:
     FRONTEND_BASE_URL = "http://buildingteste.ddns.net:8081"
     
     # API Endpoints / Endpoints da API
-    API_ENDPOINTS = {
+    API_ENDPOINTS = _freeze({
         # Authentication / Autenticação
         'auth_login': f"{FRONTEND_BASE_URL}/auth/login",
         'auth_logout': f"{FRONTEND_BASE_URL}/auth/logout",
@@ -59,10 +88,15 @@ class ConfigService:
         'admin_users': f"{FRONTEND_BASE_URL}/admin/users",
         'admin_settings': f"{FRONTEND_BASE_URL}/admin/settings",
         'admin_audit': f"{FRONTEND_BASE_URL}/admin/audit",
-    }
+    })
+    
+    # Endpoints split once into literal URLs and URLs that take parameters
+    # Endpoints divididos uma vez em URLs literais e URLs que recebem parâmetros
+    _STATIC_ENDPOINTS = MappingProxyType({key: url for key, url in API_ENDPOINTS.items() if '{' not in url})
+    _TEMPLATE_ENDPOINTS = MappingProxyType({key: url for key, url in API_ENDPOINTS.items() if '{' in url})
     
     # Microservices Configuration / Configuração dos Microserviços
-    MICROSERVICES = {
+    MICROSERVICES = _freeze({
         'accounts-payable': {
             'url': 'http://localhost:5000',
             'health_endpoint': '/health',
@@ -143,23 +177,24 @@ class ConfigService:
             'health_endpoint': '/health',
             'timeout': 30
         }
-    }
+    })
     
     # Database Configuration / Configuração do Banco de Dados
-    DATABASE_CONFIG = {
+    DATABASE_CONFIG = _freeze({
         'host': os.getenv('DB_HOST', 'localhost'),
         'port': int(os.getenv('DB_PORT', '3306')),
         'username': os.getenv('DB_USERNAME', 'root'),
         'password': os.getenv('DB_PASSWORD', 'password'),
         'database': os.getenv('DB_NAME', 'construction_hub_financial'),
         'charset': 'utf8mb4',
-        'pool_size': 10,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '10')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '40')),  # Burst up to 50 connections / Pico de até 50 conexões
         'pool_timeout': 30,
         'pool_recycle': 3600
-    }
+    })
     
     # Security Configuration / Configuração de Segurança
-    SECURITY_CONFIG = {
+    SECURITY_CONFIG = _freeze({
         'jwt_secret_key': os.getenv('JWT_SECRET_KEY', 'financial_advanced_jwt_secret_2024'),
         'jwt_expiration_hours': 24,
         'password_min_length': 8,
@@ -167,39 +202,40 @@ class ConfigService:
         'max_login_attempts': 5,
         'lockout_duration_minutes': 30,
         'session_timeout_minutes': 120
-    }
+    })
     
     # Audit Configuration / Configuração de Auditoria
-    AUDIT_CONFIG = {
+    AUDIT_CONFIG = _freeze({
         'enabled': True,
         'log_all_requests': True,
         'log_request_body': True,
         'log_response_body': False,  # For performance / Para performance
         'retention_days': 2555,  # 7 years / 7 anos
-        'high_risk_actions': [
-            'DELETE', 'TRANSFER_FUNDS', 'APPROVE_PAYMENT', 
-            'MODIFY_BUDGET', 'CHANGE_PERMISSIONS'
-        ],
+        'batch_size': 500,  # Events per database write / Eventos por escrita no banco
+        'flush_interval_seconds': 5.0,  # Max wait to fill a batch / Espera máxima para preencher um lote
+        'queue_max_size': 10000,  # Pending events before new ones are dropped / Eventos pendentes antes de descartar novos
+        'wal_dir': os.getenv('AUDIT_WAL_DIR', '/tmp/financial-advanced-audit-wal'),  # Empty disables / Vazio desabilita
+        'high_risk_actions': HIGH_RISK_ACTIONS,
         'compliance_requirements': [
             'SOX',  # Sarbanes-Oxley Act
             'PIPEDA',  # Personal Information Protection and Electronic Documents Act
             'AODA',  # Accessibility for Ontarians with Disabilities Act
             'FINTRAC'  # Financial Transactions and Reports Analysis Centre of Canada
         ]
-    }
+    })
     
     # Logging Configuration / Configuração de Logging
-    LOGGING_CONFIG = {
+    LOGGING_CONFIG = _freeze({
         'level': os.getenv('LOG_LEVEL', 'INFO'),
         'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         'file_path': os.getenv('LOG_FILE_PATH', '/var/log/construction-hub/financial-advanced.log'),
         'max_file_size_mb': 100,
         'backup_count': 10,
         'enable_console': True
-    }
+    })
     
     # Canadian Banking Configuration / Configuração Bancária Canadense
-    CANADIAN_BANKING = {
+    CANADIAN_BANKING = _freeze({
         'supported_banks': [
             'RBC',  # Royal Bank of Canada
             'TD',   # Toronto-Dominion Bank
@@ -230,17 +266,34 @@ class ConfigService:
             '2024-12-25',  # Christmas Day
             '2024-12-26'   # Boxing Day
         ]
-    }
+    })
+    
+    # Holidays parsed once for O(1) lookups / Feriados convertidos uma vez para consultas O(1)
+    BANKING_HOLIDAYS_SET = frozenset(date.fromisoformat(day) for day in CANADIAN_BANKING['banking_holidays'])
+    
+    # Business days as a weekday bitmask, bit 0 = Monday / Dias úteis como máscara de bits, bit 0 = segunda-feira
+    BUSINESS_DAY_MASK = sum(1 << _WEEKDAYS[day] for day in CANADIAN_BANKING['business_days'])
     
     # Performance Configuration / Configuração de Performance
-    PERFORMANCE_CONFIG = {
+    PERFORMANCE_CONFIG = _freeze({
         'cache_enabled': True,
         'cache_ttl_seconds': 300,  # 5 minutes / 5 minutos
+        'dashboard_cache_ttl_seconds': 30,  # Polled dashboards and reports / Painéis e relatórios consultados
+        'summary_cache_ttl_seconds': 60,  # Cross-service aggregates / Agregados entre serviços
+        'local_cache_ttl_seconds': 10,  # In-process tier / Camada em processo
+        'consistency_fresh_seconds': 30,  # Served without refresh / Servido sem atualização
+        'consistency_stale_seconds': 300,  # Served while refreshing / Servido durante a atualização
+        'data_flow_fresh_seconds': 10,
+        'data_flow_stale_seconds': 60,
+        'cache_type': os.getenv('CACHE_TYPE', 'RedisCache'),
+        'redis_url': os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
         'rate_limit_per_minute': 1000,
         'max_concurrent_requests': 100,
         'request_timeout_seconds': 30,
-        'bulk_operation_batch_size': 1000
-    }
+        'bulk_operation_batch_size': 1000,
+        'job_timeout_seconds': 600,  # Background jobs / Tarefas em segundo plano
+        'health_check_cache_seconds': 2.0  # Database ping reuse window / Janela de reutilização do ping do banco
+    })
     
     @classmethod
     def get_frontend_url(cls, endpoint_key: str, **kwargs) -> str:
@@ -255,18 +308,22 @@ class ConfigService:
         Returns:
             str: Formatted URL / URL formatada
         """
-        url = cls.API_ENDPOINTS.get(endpoint_key)
-        if url and kwargs:
-            url = url.format(**kwargs)
-        return url
+        url = cls._STATIC_ENDPOINTS.get(endpoint_key)
+        if url is not None:
+            return url
+        
+        template = cls._TEMPLATE_ENDPOINTS.get(endpoint_key)
+        if template and kwargs:
+            return template.format_map(kwargs)
+        return template
     
     @classmethod
-    def get_microservice_config(cls, service_name: str) -> Dict[str, Any]:
+    def get_microservice_config(cls, service_name: str) -> Mapping[str, Any]:
         """
-        Get configuration for specific microservice
-        Obter configuração para microserviço específico
+        Get configuration for specific microservice (read-only)
+        Obter configuração para microserviço específico (somente leitura)
         """
-        return cls.MICROSERVICES.get(service_name, {})
+        return cls.MICROSERVICES.get(service_name, _EMPTY_CONFIG)
     
     @classmethod
     def get_database_url(cls) -> str:
@@ -274,10 +331,7 @@ class ConfigService:
         Get database connection URL
         Obter URL de conexão do banco de dados
         """
-        config = cls.DATABASE_CONFIG
-        return (f"mysql+pymysql://{config['username']}:{config['password']}"
-                f"@{config['host']}:{config['port']}/{config['database']}"
-                f"?charset={config['charset']}")
+        return _database_url()
     
     @classmethod
     def is_audit_enabled(cls) -> bool:
@@ -294,4 +348,29 @@ class ConfigService:
         Obter lista de idiomas suportados
         """
         return ['en-CA', 'pt-BR', 'en-US', 'fr-CA']  # Canadian English, Portuguese, US English, Canadian French
+    
+    @classmethod
+    def is_banking_holiday(cls, day: date) -> bool:
+        """
+        Check whether a date is a Canadian banking holiday
+        Verificar se uma data é feriado bancário canadense
+        """
+        return day in cls.BANKING_HOLIDAYS_SET
+    
+    @classmethod
+    def is_business_day(cls, day: date) -> bool:
+        """
+        Check whether a date falls on a configured business weekday
+        Verificar se uma data cai em um dia útil configurado
+        """
+        return bool(cls.BUSINESS_DAY_MASK >> day.weekday() & 1)
+
+# Derived values are fixed for the life of the process, so they are built once
+# Valores derivados são fixos durante a vida do processo, então são construídos uma vez
 
+@lru_cache(maxsize=None)
+def _database_url() -> str:
+    config = ConfigService.DATABASE_CONFIG
+    return (f"mysql+pymysql://{config['username']}:{config['password']}"
+            f"@{config['host']}:{config['port']}/{config['database']}"
+            f"?charset={config['charset']}")
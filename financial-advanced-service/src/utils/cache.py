@@ -0,0 +1,145 @@
+"""
+Cache - Shared response cache for read-heavy endpoints
+Backed by Flask-Caching and configured from ConfigService.PERFORMANCE_CONFIG
+
+Expensive fan-out results can also use the two-tier helpers: an in-process
+LRU in front of the shared backend, so repeat reads skip the network hop.
+Staleness-tolerant results use swr_get on top of them, serving the last
+value while a background thread fetches the next one.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from cachetools import LRUCache
+from flask import current_app, request
+from flask_caching import Cache
+from src.services.config_service import ConfigService
+
+logger = logging.getLogger(__name__)
+
+cache = Cache()
+
+_local_cache = LRUCache(maxsize=2048)
+_local_lock = threading.Lock()
+_LOCAL_TTL = ConfigService.PERFORMANCE_CONFIG['local_cache_ttl_seconds']
+
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cache-refresh')
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def init_cache(app):
+    """Bind the shared cache to the application"""
+    performance = ConfigService.PERFORMANCE_CONFIG
+    cache.init_app(app, config={
+        'CACHE_TYPE': performance['cache_type'] if performance['cache_enabled'] else 'NullCache',
+        'CACHE_REDIS_URL': performance['redis_url'],
+        'CACHE_DEFAULT_TIMEOUT': performance['cache_ttl_seconds'],
+        'CACHE_KEY_PREFIX': 'financial-advanced:'
+    })
+
+
+def is_cacheable(rv):
+    """Cache plain view results only, never (body, status) error tuples"""
+    return not isinstance(rv, tuple)
+
+
+def canonical_key(prefix):
+    """
+    Build a cache key from the request's query string that ignores argument order,
+    so equivalent requests share one entry; values are kept exactly as sent because
+    the views pass them on to services unchanged
+    """
+    items = sorted(request.args.items(multi=True))
+    return prefix + '?' + urlencode(items)
+
+
+def _view_cache_key(*args, **kwargs):
+    # Routes match with or without a trailing slash (strict_slashes is off), so both share one entry
+    return canonical_key(request.path.rstrip('/') or '/')
+
+
+def cached_view(timeout=None, unless=None):
+    """Cache a GET view per path and canonical query string"""
+    # No response_hit_indication: Flask-Caching implements it by registering an
+    # after_request hook on every call, which leaks and tags unrelated responses
+    return cache.cached(
+        timeout=timeout,
+        make_cache_key=_view_cache_key,
+        unless=unless,
+        response_filter=is_cacheable
+    )
+
+
+def tiered_get(key):
+    """Look up key in the local LRU, then the shared cache; shared hits are promoted locally"""
+    now = time.monotonic()
+    with _local_lock:
+        entry = _local_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    try:
+        value = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Shared cache read failed for {key}: {str(e)}")
+        return None
+
+    if value is not None:
+        with _local_lock:
+            _local_cache[key] = (now + _LOCAL_TTL, value)
+    return value
+
+
+def tiered_put(key, value, ttl):
+    """Store value in both tiers; the local copy never outlives the shared one"""
+    with _local_lock:
+        _local_cache[key] = (time.monotonic() + min(ttl, _LOCAL_TTL), value)
+    try:
+        cache.set(key, value, timeout=ttl)
+    except Exception as e:
+        logger.warning(f"Shared cache write failed for {key}: {str(e)}")
+
+
+def _swr_store(key, fetch, fresh_ttl, stale_ttl):
+    """Fetch a new value and store it with the wall-clock time it stays fresh until"""
+    value = fetch()
+    # Wall clock, not monotonic: entries are shared with other processes
+    tiered_put(key, (time.time() + fresh_ttl, value), stale_ttl)
+    return value
+
+
+def _swr_refresh(app, key, fetch, fresh_ttl, stale_ttl):
+    """Background refresh of a stale entry; failures keep serving the stale value"""
+    try:
+        with app.app_context():
+            _swr_store(key, fetch, fresh_ttl, stale_ttl)
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {key}: {str(e)}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(key)
+
+
+def swr_get(key, fetch, fresh_ttl, stale_ttl):
+    """
+    Stale-while-revalidate read: fresh entries are returned as is, stale ones are
+    returned immediately while fetch() runs in the background, misses call fetch() inline
+    """
+    entry = tiered_get(key)
+    if entry is None:
+        return _swr_store(key, fetch, fresh_ttl, stale_ttl)
+
+    fresh_until, value = entry
+    if fresh_until <= time.time():
+        with _refreshing_lock:
+            schedule = key not in _refreshing
+            _refreshing.add(key)
+        if schedule:
+            app = current_app._get_current_object()
+            _refresh_executor.submit(_swr_refresh, app, key, fetch, fresh_ttl, stale_ttl)
+    return value
@@ -0,0 +1,64 @@
+"""
+HTTP Helpers - Request parsing and response decorators
+Shared by the route blueprints
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import current_app, make_response, request
+from pydantic import ValidationError
+from werkzeug.exceptions import HTTPException
+from src.utils.json_response import ojsonify
+
+_TRUE = frozenset(('true', '1', 'yes', 'on'))
+
+
+def etagged(f):
+    """Tag successful responses with a strong ETag and answer If-None-Match with 304"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200:
+            # Bodies are key-sorted JSON, so equal payloads hash to the same tag
+            response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+            response = response.make_conditional(request)
+        return response
+
+    return decorated_function
+
+
+def safe_json(f):
+    """Turn handler exceptions into JSON errors: body validation and ValueError are a 400, anything else a 500.
+    HTTP exceptions (abort, bad JSON, 404) keep their own status"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except HTTPException:
+            raise
+        except ValidationError as e:
+            # Field locations and messages only, without echoed input or docs links
+            return ojsonify({
+                'success': False,
+                'error': 'Invalid request body',
+                'details': e.errors(include_url=False, include_context=False, include_input=False)
+            }), 400
+        except ValueError as e:
+            return ojsonify({'success': False, 'error': str(e)}), 400
+        except Exception as e:
+            current_app.logger.exception(f"Unhandled error in {request.endpoint}")
+            return ojsonify({'success': False, 'error': str(e)}), 500
+
+    return decorated_function
+
+
+def qbool(name, default=False):
+    """Read a boolean query flag; true, 1, yes and on (any case) count as set"""
+    value = request.args.get(name)
+    return default if value is None else value.lower() in _TRUE
+
+
+def parse_body(schema):
+    """Validate the JSON request body against a pydantic schema; an empty body gets the defaults"""
+    return schema.model_validate_json(request.get_data() or b'{}')
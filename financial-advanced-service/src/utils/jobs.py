@@ -0,0 +1,42 @@
+"""
+Jobs - Background task queue for long-running cross-service work
+Backed by RQ on the same Redis instance as the shared cache
+"""
+
+import redis
+from flask import g
+from rq import Queue
+from src.services.config_service import ConfigService
+
+JOB_TIMEOUT_SECONDS = ConfigService.PERFORMANCE_CONFIG['job_timeout_seconds']
+
+job_queue = Queue(
+    'financial',
+    connection=redis.Redis.from_url(ConfigService.PERFORMANCE_CONFIG['redis_url'])
+)
+
+
+def run_job(service_class, method_name, *args):
+    """Worker entry point: call a service method inside the application context"""
+    # RQ workers run outside the web process, so the app (and db) is set up here
+    from src.main import app
+
+    with app.app_context():
+        return getattr(service_class(), method_name)(*args)
+
+
+def enqueue_job(service_class, method_name, *args):
+    """Queue service_class().method_name(*args) for a worker, owned by the current user, and return the RQ job"""
+    return job_queue.enqueue(
+        run_job, service_class, method_name, *args,
+        job_timeout=JOB_TIMEOUT_SECONDS,
+        meta={'user_id': g.user_id}
+    )
+
+
+def fetch_user_job(job_id, user_id):
+    """Return a job queued through enqueue_job by user_id, or None for unknown and foreign jobs"""
+    job = job_queue.fetch_job(job_id)
+    if job is None or job.func_name != f'{__name__}.run_job' or job.meta.get('user_id') != user_id:
+        return None
+    return job
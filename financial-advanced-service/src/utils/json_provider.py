@@ -0,0 +1,49 @@
+"""
+JSON Provider - orjson-backed serialization for Flask
+Replaces the stdlib json encoder behind jsonify() and request.get_json()
+"""
+
+import decimal
+from collections.abc import Mapping
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+def json_default(o):
+    """Serialize types orjson does not handle natively, matching Flask's defaults"""
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    # Read-only configuration views and sets / Visões de configuração somente leitura e conjuntos
+    if isinstance(o, Mapping):
+        return dict(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from the encoded bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._encode(obj, orjson.OPT_INDENT_2 if pretty else 0)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def _encode(self, obj, extra_options=0):
+        options = self.options | extra_options
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=json_default, option=options)
@@ -0,0 +1,21 @@
+"""
+JSON Response - Direct orjson responses for route handlers
+Serializes straight to bytes and skips Flask's JSON provider dispatch
+"""
+
+import orjson
+from flask import Response
+from src.utils.json_provider import OrjsonProvider, json_default
+
+# Same options as the app provider, keys sorted so equal payloads give equal bytes
+_OPTIONS = OrjsonProvider.options | orjson.OPT_SORT_KEYS
+
+
+def ojsonify(obj, status=200):
+    """Build a JSON response from obj encoded with orjson"""
+    return Response(
+        orjson.dumps(obj, default=json_default, option=_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+